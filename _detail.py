@@ -1,5 +1,53 @@
-from . import rpc as _rpc
-
 def _check_inheritance(self):
+	from . import rpc as _rpc
 	if not issubclass(type(self),_rpc.agent):
 		raise TypeError('this class must be a subclass of the rpc agent class')
+
+def _timed_init(init):
+	# Decorator for the constructors of agent classes. It records how much time each
+	# class in the cooperative __init__ chain spends on its own (i.e., excluding the
+	# time spent in the constructors further down the MRO), so that the cost of
+	# building a composed agent can be broken down per component. Subclasses of the
+	# rpc agent are wrapped automatically, mixins need to be decorated explicitly.
+	from functools import wraps
+	from time import perf_counter
+	name = init.__module__ + '.' + init.__qualname__.rsplit('.',1)[0]
+	@wraps(init)
+	def wrapper(self,*args,**kwargs):
+		frames = self.__dict__.get('_startup_frames_')
+		if frames is None:
+			frames = self._startup_frames_ = []
+		# Each frame is [name, start time, time spent in nested constructors].
+		# NOTE: this assumes the constructors form a single cooperative chain via super(),
+		# so that the caller of a constructor is always the frame right before it.
+		idx = len(frames)
+		frames.append([name,perf_counter(),0.])
+		completed = False
+		try:
+			init(self,*args,**kwargs)
+			completed = True
+		finally:
+			frame = frames[idx]
+			elapsed = perf_counter() - frame[1]
+			frame[1] = elapsed - frame[2]
+			if idx != 0:
+				frames[idx - 1][2] += elapsed
+			else:
+				del self._startup_frames_
+				self._startup_profile_ = [(n,t) for n, t, _ in frames]
+				# Report only agents which were actually built.
+				if completed:
+					_log_startup_profile(self._startup_profile_)
+	wrapper._timed_init_ = True
+	return wrapper
+
+def _log_startup_profile(profile):
+	import logging
+	l = logging.getLogger('jezebel.startup')
+	if not l.isEnabledFor(logging.INFO):
+		return
+	total = sum(t for _, t in profile)
+	report = 'agent constructed in %.6fs:' % total
+	for n, t in profile:
+		report += '\n  %-28s %.6fs' % (n,t)
+	l.info(report)
@@ -1,59 +1,71 @@
 from . import _detail, rpc as _rpc
-import http.server as _server, threading as _thr
-from socketserver import ThreadingMixIn as _thr_mixin
 
-class _req_handler(_server.BaseHTTPRequestHandler):
-	# Use 1.0 as it is most minimialist (no mandatory header parts).
-	protocol_version = "HTTP/1.0"
-	def __init__(self,*args,**kwargs):
-		import logging
-		self.__logger = logging.getLogger('jezebel.http.agent')
-		super().__init__(*args,**kwargs)
-	def __return_client_error(self,code,msg):
-		self.send_response(code)
-		self.send_header('Content-type','text/plain; charset="utf-8"')
-		self.end_headers()
-		self.wfile.write(msg.encode('utf-8'))
-	def do_GET(self):
-		self.send_response(200)
-		self.send_header('Content-type','html')
-		self.end_headers()
-		self.wfile.write(bytes('<!DOCTYPE html><html><head><title>Hey there!</title></head><body><p>I am an agent \o/</p></body></html>','utf-8'))
-	def do_POST(self):
-		try:
-			length = int(self.headers['Content-Length'])
-			c_type = self.headers['Content-type']
-			a_type = self.headers['Accept']
-			req = self.rfile.read(length).decode('utf-8')
-		except BaseException as e:
-			return self.__return_client_error(400,'Exception caught while examining the HTTP header: ' + repr(e))
-		self.__logger.info('received POST request:\n' + req)
-		if not 'application/json' in c_type:
-			return self.__return_client_error(400,'Invalid content type "' + c_type + '" in request (it should contain "application/json")')
-		if not 'application/json' in a_type:
-			return self.__return_client_error(400,'Invalid acceptable content type "' + a_type + '" in request (it should contain "application/json")')
-		retval = self.server.agent.execute_request(req)
-		self.send_response(200)
-		self.send_header('Content-type','application/json')
-		self.end_headers()
-		if not retval is None:
-			self.__logger.info('replying with:\n' + retval)
-			self.wfile.write(retval.encode('utf-8'))
+# The server classes are built on first use, so that agents which never open an
+# HTTP endpoint do not pay for importing the HTTP server machinery.
+_server_type = None
 
-class _mt_http_server(_thr_mixin,_server.HTTPServer):
-	pass
+def _load_server_type():
+	global _server_type
+	# NOTE: concurrent first calls might build the classes more than once, which is harmless.
+	if not _server_type is None:
+		return _server_type
+	import http.server as _server, threading as _thr
+	from socketserver import ThreadingMixIn as _thr_mixin
+	class _req_handler(_server.BaseHTTPRequestHandler):
+		# Use 1.0 as it is most minimialist (no mandatory header parts).
+		protocol_version = "HTTP/1.0"
+		def __init__(self,*args,**kwargs):
+			import logging
+			self.__logger = logging.getLogger('jezebel.http.agent')
+			super().__init__(*args,**kwargs)
+		def __return_client_error(self,code,msg):
+			self.send_response(code)
+			self.send_header('Content-type','text/plain; charset="utf-8"')
+			self.end_headers()
+			self.wfile.write(msg.encode('utf-8'))
+		def do_GET(self):
+			self.send_response(200)
+			self.send_header('Content-type','html')
+			self.end_headers()
+			self.wfile.write(bytes('<!DOCTYPE html><html><head><title>Hey there!</title></head><body><p>I am an agent \o/</p></body></html>','utf-8'))
+		def do_POST(self):
+			try:
+				length = int(self.headers['Content-Length'])
+				c_type = self.headers['Content-type']
+				a_type = self.headers['Accept']
+				req = self.rfile.read(length).decode('utf-8')
+			except BaseException as e:
+				return self.__return_client_error(400,'Exception caught while examining the HTTP header: ' + repr(e))
+			self.__logger.info('received POST request:\n' + req)
+			if not 'application/json' in c_type:
+				return self.__return_client_error(400,'Invalid content type "' + c_type + '" in request (it should contain "application/json")')
+			if not 'application/json' in a_type:
+				return self.__return_client_error(400,'Invalid acceptable content type "' + a_type + '" in request (it should contain "application/json")')
+			retval = self.server.agent.execute_request(req)
+			self.send_response(200)
+			self.send_header('Content-type','application/json')
+			self.end_headers()
+			if not retval is None:
+				self.__logger.info('replying with:\n' + retval)
+				self.wfile.write(retval.encode('utf-8'))
 
-class _thr_server(_thr.Thread):
-	def __init__(self,server_address,req_handler):
-		import logging
-		self.__logger = logging.getLogger('jezebel.http.agent')
-		self.server = _mt_http_server(server_address,_req_handler)
-		super().__init__()
-	def run(self):
-		self.__logger.info('starting HTTP server at address ' + str(self.server.server_address))
-		self.server.serve_forever()
+	class _mt_http_server(_thr_mixin,_server.HTTPServer):
+		pass
+
+	class _thr_server(_thr.Thread):
+		def __init__(self,server_address):
+			import logging
+			self.__logger = logging.getLogger('jezebel.http.agent')
+			self.server = _mt_http_server(server_address,_req_handler)
+			super().__init__()
+		def run(self):
+			self.__logger.info('starting HTTP server at address ' + str(self.server.server_address))
+			self.server.serve_forever()
+	_server_type = _thr_server
+	return _server_type
 
 class agent(object):
+	@_detail._timed_init
 	def __init__(self,http_address = None,http_timeout = 10.,**kwargs):
 		import logging
 		_detail._check_inheritance(self)
@@ -72,7 +84,7 @@ class agent(object):
 		# Create the server object only if requested.
 		if not http_address is None:
 			# Create the threaded server object.
-			self.__server = _thr_server(http_address,_req_handler)
+			self.__server = _load_server_type()(http_address)
 			# Make the agent reachable from the server.
 			self.__server.server.agent = self
 			# Start the server.
@@ -1,6 +1,7 @@
 from . import rpc as _rpc, _detail
 
 class agent(object):
+	@_detail._timed_init
 	def __init__(self,**kwargs):
 		from threading import Lock
 		import logging
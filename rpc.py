@@ -7,6 +7,8 @@
 
 """
 
+from . import _detail
+
 class error_codes(object):
 	PARSE_ERROR		= -32700
 	INVALID_REQUEST		= -32600
@@ -22,11 +24,19 @@ def enable_rpc(method):
 	return method
 
 class agent(object):
+	@_detail._timed_init
 	def __init__(self,**kwargs):
 		import logging
 		self.__logger = logging.getLogger('jezebel.rpc.agent')
 		self.__logger.info('initialising rpc agent')
 		super().__init__(**kwargs)
+	def __init_subclass__(cls,**kwargs):
+		# Time the constructors of all agent types, including user-defined ones
+		# which do not use the decorator explicitly.
+		super().__init_subclass__(**kwargs)
+		init = cls.__dict__.get('__init__')
+		if not init is None and not hasattr(init,'_timed_init_'):
+			cls.__init__ = _detail._timed_init(init)
 	@staticmethod
 	def translate_rpc_error(code,message):
 		if not isinstance(code,int) or not isinstance(message,str):
@@ -213,5 +223,19 @@ class agent(object):
 	@enable_rpc
 	def features(self):
 		return list(filter(lambda _: hasattr(getattr(self,_),'_enable_rpc_'),dir(self)))
+	@property
+	def startup_profile(self):
+		"""Startup profile.
+		
+		List of ``(name, seconds)`` pairs, in MRO order, reporting the time spent by each agent class
+		in its own constructor (nested constructors excluded). Constructors of subclasses of :class:`agent`
+		are measured automatically, while the time spent in mixins which are not subclasses of :class:`agent`
+		is measured only if their constructor is decorated with ``_detail._timed_init``, and it is otherwise
+		attributed to the measured constructor calling them. The same breakdown is logged at the end
+		of a successful construction through the ``jezebel.startup`` logger. The list is empty if no
+		measured constructor was run.
+		
+		"""
+		return list(getattr(self,'_startup_profile_',[]))
 	def disconnect(self):
 		pass
@@ -1,10 +1,9 @@
 from . import rpc as _rpc, _detail
 
 class agent(object):
+	@_detail._timed_init
 	def __init__(self,jid = None,jpassword = None,xmpp_timeout = 10,**kwargs):
-		from sleekxmpp import ClientXMPP
 		from threading import Condition, Lock
-		import ssl
 		import logging
 		from time import time
 		_detail._check_inheritance(self)
@@ -31,6 +30,10 @@ class agent(object):
 			#  Finalize construction and return immediately if no jid is provided.
 			super().__init__(**kwargs)
 			return
+		# NOTE: sleekxmpp is imported only when a connection is actually requested, so that
+		# agents without a jid do not need it installed.
+		from sleekxmpp import ClientXMPP
+		import ssl
 		# Create the XMPP client as a class member.
 		self.__xmpp_client = ClientXMPP(jid,jpassword)
 		# The SSL setting is needed for openfire.